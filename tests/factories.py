@@ -17,32 +17,39 @@
 """
 Test Factory to make fake objects for testing
 """
-import random
+from decimal import Decimal
+from random import Random
 import factory
-from factory.fuzzy import FuzzyDecimal
+from factory.fuzzy import FuzzyChoice
+from faker import Faker
 from service.models import Product, Category
 
-AVAILABILITY = [True, False]
-PRODUCT_NAME = ["Hat",
-                "Pants",
-                "Shirt",
-                "Apple",
-                "Banana",
-                "Pots",
-                "Towels",
-                "Ford",
-                "Chevy",
-                "Hammer",
-                "Wrench"]
-
-
-class CustomFactory():
-    """ Creates fake Accounts """
-
-    @classmethod
-    def random_choice(cls, types) -> list:
-        """ This randomly choice a value in the list of types """
-        return random.choice(types)
+_AVAILABILITY = (True, False)
+_PRODUCT_NAME = ("Hat",
+                 "Pants",
+                 "Shirt",
+                 "Apple",
+                 "Banana",
+                 "Pots",
+                 "Towels",
+                 "Ford",
+                 "Chevy",
+                 "Hammer",
+                 "Wrench")
+_CATEGORIES = (Category.UNKNOWN,
+               Category.CLOTHS,
+               Category.FOOD,
+               Category.HOUSEWARES,
+               Category.AUTOMOTIVE,
+               Category.TOOLS)
+# generating lorem text is slow, so build a pool of descriptions once
+# from a seeded generator so the pool is the same in every run
+_fake = Faker()
+_fake.seed_instance(0)
+_FAKE_TEXT_POOL = tuple(_fake.text() for _ in range(64))
+# prices are sampled from a precomputed table instead of a new Decimal per product
+_rng = Random(0)
+_PRICES = tuple(Decimal(f"{_rng.uniform(0.5, 2000.0):.2f}") for _ in range(4096))
 
 
 class ProductFactory(factory.Factory):
@@ -55,14 +62,8 @@ class ProductFactory(factory.Factory):
 
     id = factory.Sequence(lambda n: n)
     # Add code to create Fake Products
-    name = CustomFactory.random_choice(types=PRODUCT_NAME)
-    description = factory.Faker("text")
-    price = FuzzyDecimal(0.5, 2000.0, 2)
-    available = CustomFactory.random_choice(types=AVAILABILITY)
-    category = CustomFactory.random_choice(
-        types=[Category.UNKNOWN,
-               Category.CLOTHS,
-               Category.FOOD,
-               Category.HOUSEWARES,
-               Category.AUTOMOTIVE,
-               Category.TOOLS])
+    name = FuzzyChoice(_PRODUCT_NAME)
+    description = FuzzyChoice(_FAKE_TEXT_POOL)
+    price = FuzzyChoice(_PRICES)
+    available = FuzzyChoice(_AVAILABILITY)
+    category = FuzzyChoice(_CATEGORIES)